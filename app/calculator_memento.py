@@ -4,28 +4,56 @@
 
 from dataclasses import dataclass, field
 import datetime
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List
 
 from app.calculation import Calculation
 
 
-@dataclass
+def _select_iso_parser() -> Callable[[str], datetime.datetime]:
+    """
+    Choose the ISO 8601 parser used to restore memento timestamps.
+
+    ciso8601 is a C parser that is considerably faster than the stdlib and is
+    listed in requirements.txt; fall back to datetime.fromisoformat when it is
+    not installed.
+
+    Returns:
+        Callable[[str], datetime.datetime]: The timestamp parser.
+    """
+    try:
+        from ciso8601 import parse_datetime as _ciso_parse
+    except ImportError:
+        return datetime.datetime.fromisoformat
+    return _ciso_parse
+
+
+parse_datetime = _select_iso_parser()
+
+
+@dataclass(slots=True, frozen=True)
 class CalculatorMemento:
     """
     Stores calculator state for undo/redo functionality.
 
     The Memento pattern allows the Calculator to save its current state (history)
-    so that it can be restored later. 
+    so that it can be restored later. The fields are frozen and cannot be
+    reassigned, but history is the caller's list and stays mutable, so
+    mementos are deliberately unhashable.
     """
 
+    # frozen=True would otherwise generate a __hash__ that fails on the history list
+    __hash__ = None
+
     history: List[Calculation]  # List of Calculation instances representing the calculator's history
-    timestamp: datetime.datetime = field(default_factory=lambda: datetime.datetime.now())  # Time when the memento was created
+    timestamp: datetime.datetime = field(default_factory=datetime.datetime.now)  # Time when the memento was created
 
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert memento to dictionary.
 
         This method serializes the memento's state into a dictionary format.
+        The history is serialized on every call, since the memento shares the
+        caller's history list and the returned dicts belong to the caller.
 
         Returns:
             Dict[str, Any]: A dictionary containing the serialized state of the memento.
@@ -49,7 +77,9 @@ class CalculatorMemento:
         Returns:
             CalculatorMemento: A new instance of CalculatorMemento with restored state.
         """
+        history = data['history']
         return cls(
-            history=[Calculation.from_dict(calc) for calc in data['history']],
-            timestamp=datetime.datetime.fromisoformat(data['timestamp'])
+            # Look up from_dict once rather than once per entry, and skip it for empty histories
+            history=list(map(Calculation.from_dict, history)) if history else [],
+            timestamp=parse_datetime(data['timestamp'])
         )
\ No newline at end of file
@@ -7,11 +7,68 @@ This module implements a dynamic help menu system that automatically
 updates based on available operations using the Decorator pattern.
 """
 
+import functools
 from abc import ABC, abstractmethod
-from typing import List, Dict
+from typing import Callable, List, Dict, FrozenSet, Optional, Tuple
 from app.operations import OperationFactory, Operation
 
 
+# Static base menu text shared by every BaseHelpMenu instance
+_BASE_HELP_TEXT = """
+╔════════════════════════════════════════════════════════════════╗
+║              ADVANCED CALCULATOR - HELP MENU                   ║
+╔════════════════════════════════════════════════════════════════╗
+
+BASIC USAGE:
+  Enter command: <operation>
+  First number: <operand1>
+  Second number: <operand2>
+  
+GENERAL COMMANDS:
+  help          - Display this help menu
+  history       - Show calculation history
+  clear         - Clear calculation history
+  undo          - Undo last operation
+  redo          - Redo previously undone operation
+  save          - Save calculation history
+  load          - Load calculation history
+  exit/quit     - Exit the calculator
+"""
+
+
+@functools.lru_cache(maxsize=16)
+def _render_operations_section(version: int, descriptions: FrozenSet[Tuple[str, str]]) -> str:
+    """
+    Render the operations section for one registry version and description set.
+    
+    The cache is bounded, so sections for superseded registry versions or
+    one-off description sets are evicted instead of accumulating.
+    
+    Args:
+        version: OperationFactory._version the section is rendered for
+        descriptions: Frozen (operation name, description) pairs
+        
+    Returns:
+        str: Formatted operations section
+    """
+    description_map = dict(descriptions)
+    parts = ["\nAVAILABLE OPERATIONS:\n", "=" * 64 + "\n"]
+    
+    # The factory keeps its operation names sorted for consistent display
+    for op_name in OperationFactory.operation_names():
+        # Get description from provided dict or use operation name
+        description = description_map.get(
+            op_name, 
+            f"Perform {op_name} operation"
+        )
+        
+        # Format the operation entry with padding
+        parts.append(f"  {op_name:<15} - {description}\n")
+    
+    parts.append("\n")
+    return "".join(parts)
+
+
 class HelpComponent(ABC):
     """
     Abstract base class for help menu components.
@@ -35,6 +92,9 @@ class BaseHelpMenu(HelpComponent):
     This is the component that decorators will wrap.
     """
     
+    # Identifiers of the sections this component renders, in order
+    _section_ids: Tuple[str, ...] = ("base",)
+    
     def get_help_text(self) -> str:
         """
         Generate base help menu text.
@@ -42,26 +102,7 @@ class BaseHelpMenu(HelpComponent):
         Returns:
             str: Base help menu
         """
-        return """
-╔════════════════════════════════════════════════════════════════╗
-║              ADVANCED CALCULATOR - HELP MENU                   ║
-╔════════════════════════════════════════════════════════════════╗
-
-BASIC USAGE:
-  Enter command: <operation>
-  First number: <operand1>
-  Second number: <operand2>
-  
-GENERAL COMMANDS:
-  help          - Display this help menu
-  history       - Show calculation history
-  clear         - Clear calculation history
-  undo          - Undo last operation
-  redo          - Redo previously undone operation
-  save          - Save calculation history
-  load          - Load calculation history
-  exit/quit     - Exit the calculator
-"""
+        return _BASE_HELP_TEXT
 
 
 class HelpMenuDecorator(HelpComponent):
@@ -70,6 +111,9 @@ class HelpMenuDecorator(HelpComponent):
     Wraps a HelpComponent and delegates to it.
     """
     
+    # Identifier of the section this decorator adds, if any
+    _section_id: Optional[str] = None
+    
     def __init__(self, component: HelpComponent):
         """
         Initialize decorator with a component to wrap.
@@ -78,6 +122,10 @@ class HelpMenuDecorator(HelpComponent):
             component: The HelpComponent to decorate
         """
         self._component = component
+        section_ids = getattr(component, '_section_ids', ())
+        if self._section_id is not None:
+            section_ids += (self._section_id,)
+        self._section_ids: Tuple[str, ...] = section_ids
     
     def get_help_text(self) -> str:
         """
@@ -87,6 +135,15 @@ class HelpMenuDecorator(HelpComponent):
             str: Help text from wrapped component
         """
         return self._component.get_help_text()
+    
+    def get_section_text(self) -> str:
+        """
+        Get only the section this decorator contributes.
+        
+        Returns:
+            str: Section text, empty for the plain delegating decorator
+        """
+        return ""
 
 
 class OperationsHelpDecorator(HelpMenuDecorator):
@@ -95,6 +152,8 @@ class OperationsHelpDecorator(HelpMenuDecorator):
     Dynamically generates operation list from OperationFactory.
     """
     
+    _section_id = "operations"
+    
     def __init__(self, component: HelpComponent, operation_descriptions: Dict[str, str] = None):
         """
         Initialize with component and optional operation descriptions.
@@ -105,6 +164,7 @@ class OperationsHelpDecorator(HelpMenuDecorator):
         """
         super().__init__(component)
         self._operation_descriptions = operation_descriptions or self._get_default_descriptions()
+        self._descriptions_key = frozenset(self._operation_descriptions.items())
     
     def _get_default_descriptions(self) -> Dict[str, str]:
         """
@@ -133,36 +193,28 @@ class OperationsHelpDecorator(HelpMenuDecorator):
         Returns:
             str: Help text including operations section
         """
-        base_text = self._component.get_help_text()
-        operations_text = self._generate_operations_section()
-        return base_text + operations_text
+        return self._component.get_help_text() + self.get_section_text()
     
-    def _generate_operations_section(self) -> str:
+    def get_section_text(self) -> str:
         """
-        Dynamically generate the operations section from OperationFactory.
+        Get the operations section for the current OperationFactory registry.
         
         Returns:
             str: Formatted operations section
         """
-        # Get all available operations from the factory
-        available_operations = OperationFactory._operations
-        
-        operations_text = "\nAVAILABLE OPERATIONS:\n"
-        operations_text += "=" * 64 + "\n"
+        return self._generate_operations_section()
+    
+    def _generate_operations_section(self) -> str:
+        """
+        Get the operations section for the current OperationFactory registry.
         
-        # Sort operations alphabetically for consistent display
-        for op_name in sorted(available_operations.keys()):
-            # Get description from provided dict or use operation name
-            description = self._operation_descriptions.get(
-                op_name, 
-                f"Perform {op_name} operation"
-            )
-            
-            # Format the operation entry with padding
-            operations_text += f"  {op_name:<15} - {description}\n"
+        The section is rebuilt only when the registry version or the
+        descriptions differ from a previously rendered section.
         
-        operations_text += "\n"
-        return operations_text
+        Returns:
+            str: Formatted operations section
+        """
+        return _render_operations_section(OperationFactory._version, self._descriptions_key)
 
 
 class ExamplesHelpDecorator(HelpMenuDecorator):
@@ -170,6 +222,8 @@ class ExamplesHelpDecorator(HelpMenuDecorator):
     Decorator that adds usage examples to the help menu.
     """
     
+    _section_id = "examples"
+    
     def __init__(self, component: HelpComponent, examples: List[str] = None):
         """
         Initialize with component and optional custom examples.
@@ -180,6 +234,8 @@ class ExamplesHelpDecorator(HelpMenuDecorator):
         """
         super().__init__(component)
         self._examples = examples or self._get_default_examples()
+        # Examples are fixed per instance, so format the section once
+        self._examples_section = self._generate_examples_section()
     
     def _get_default_examples(self) -> List[str]:
         """
@@ -208,9 +264,16 @@ class ExamplesHelpDecorator(HelpMenuDecorator):
         Returns:
             str: Help text including examples section
         """
-        base_text = self._component.get_help_text()
-        examples_text = self._generate_examples_section()
-        return base_text + examples_text
+        return self._component.get_help_text() + self._examples_section
+    
+    def get_section_text(self) -> str:
+        """
+        Get the precomputed examples section.
+        
+        Returns:
+            str: Formatted examples section
+        """
+        return self._examples_section
     
     def _generate_examples_section(self) -> str:
         """
@@ -219,14 +282,10 @@ class ExamplesHelpDecorator(HelpMenuDecorator):
         Returns:
             str: Formatted examples section
         """
-        examples_text = "USAGE EXAMPLES:\n"
-        examples_text += "=" * 64 + "\n"
-        
-        for example in self._examples:
-            examples_text += f"  {example}\n"
-        
-        examples_text += "\n"
-        return examples_text
+        parts = ["USAGE EXAMPLES:\n", "=" * 64 + "\n"]
+        parts.extend(f"  {example}\n" for example in self._examples)
+        parts.append("\n")
+        return "".join(parts)
 
 
 class NotesHelpDecorator(HelpMenuDecorator):
@@ -234,6 +293,8 @@ class NotesHelpDecorator(HelpMenuDecorator):
     Decorator that adds notes and tips to the help menu.
     """
     
+    _section_id = "notes"
+    
     def __init__(self, component: HelpComponent, notes: List[str] = None):
         """
         Initialize with component and optional custom notes.
@@ -244,6 +305,8 @@ class NotesHelpDecorator(HelpMenuDecorator):
         """
         super().__init__(component)
         self._notes = notes or self._get_default_notes()
+        # Notes and footer are fixed per instance, so format them once
+        self._notes_section = self._generate_notes_section() + self._generate_footer()
     
     def _get_default_notes(self) -> List[str]:
         """
@@ -268,10 +331,16 @@ class NotesHelpDecorator(HelpMenuDecorator):
         Returns:
             str: Help text including notes section
         """
-        base_text = self._component.get_help_text()
-        notes_text = self._generate_notes_section()
-        footer = self._generate_footer()
-        return base_text + notes_text + footer
+        return self._component.get_help_text() + self._notes_section
+    
+    def get_section_text(self) -> str:
+        """
+        Get the precomputed notes section, including the footer.
+        
+        Returns:
+            str: Formatted notes section and footer
+        """
+        return self._notes_section
     
     def _generate_notes_section(self) -> str:
         """
@@ -280,14 +349,10 @@ class NotesHelpDecorator(HelpMenuDecorator):
         Returns:
             str: Formatted notes section
         """
-        notes_text = "NOTES & TIPS:\n"
-        notes_text += "=" * 64 + "\n"
-        
-        for note in self._notes:
-            notes_text += f"  {note}\n"
-        
-        notes_text += "\n"
-        return notes_text
+        parts = ["NOTES & TIPS:\n", "=" * 64 + "\n"]
+        parts.extend(f"  {note}\n" for note in self._notes)
+        parts.append("\n")
+        return "".join(parts)
     
     def _generate_footer(self) -> str:
         """
@@ -299,6 +364,43 @@ class NotesHelpDecorator(HelpMenuDecorator):
         return "╚════════════════════════════════════════════════════════════════╝\n"
 
 
+class SectionedHelpMenu(HelpComponent):
+    """
+    Flat help menu that joins the sections collected by HelpMenuBuilder.
+    Produces the same text as the equivalent decorator stack without
+    recursing through each decorator on every call.
+    """
+    
+    def __init__(self, sections: List[Callable[[], str]], section_ids: Tuple[str, ...] = ()):
+        """
+        Initialize with the ordered section providers.
+        
+        Args:
+            sections: Callables returning each section's text, base menu first
+            section_ids: Identifiers of those sections, in the same order
+        """
+        self._sections = tuple(sections)
+        self._section_ids = section_ids
+        self._rendered_version: Optional[int] = None
+        self._rendered_text = ""
+    
+    def get_help_text(self) -> str:
+        """
+        Join all sections into the complete help text.
+        
+        Only the operations section can change after build, so the joined
+        text is reused until the OperationFactory registry version changes.
+        
+        Returns:
+            str: Complete help text
+        """
+        version = OperationFactory._version
+        if self._rendered_version != version:
+            self._rendered_text = "".join([section() for section in self._sections])
+            self._rendered_version = version
+        return self._rendered_text
+
+
 class HelpMenuBuilder:
     """
     Builder class for constructing help menus with decorators.
@@ -308,6 +410,21 @@ class HelpMenuBuilder:
     def __init__(self):
         """Initialize builder with base help menu."""
         self._component = BaseHelpMenu()
+        self._sections: List[Callable[[], str]] = [self._component.get_help_text]
+    
+    def _add(self, decorator: HelpMenuDecorator) -> 'HelpMenuBuilder':
+        """
+        Apply a decorator and record the section it contributes.
+        
+        Args:
+            decorator: Decorator wrapping the current component
+            
+        Returns:
+            Self for method chaining
+        """
+        self._component = decorator
+        self._sections.append(decorator.get_section_text)
+        return self
     
     def with_operations(self, operation_descriptions: Dict[str, str] = None) -> 'HelpMenuBuilder':
         """
@@ -319,8 +436,7 @@ class HelpMenuBuilder:
         Returns:
             Self for method chaining
         """
-        self._component = OperationsHelpDecorator(self._component, operation_descriptions)
-        return self
+        return self._add(OperationsHelpDecorator(self._component, operation_descriptions))
     
     def with_examples(self, examples: List[str] = None) -> 'HelpMenuBuilder':
         """
@@ -332,8 +448,7 @@ class HelpMenuBuilder:
         Returns:
             Self for method chaining
         """
-        self._component = ExamplesHelpDecorator(self._component, examples)
-        return self
+        return self._add(ExamplesHelpDecorator(self._component, examples))
     
     def with_notes(self, notes: List[str] = None) -> 'HelpMenuBuilder':
         """
@@ -345,31 +460,64 @@ class HelpMenuBuilder:
         Returns:
             Self for method chaining
         """
-        self._component = NotesHelpDecorator(self._component, notes)
-        return self
+        return self._add(NotesHelpDecorator(self._component, notes))
     
     def build(self) -> HelpComponent:
         """
         Build and return the final help menu component.
         
         Returns:
-            Complete HelpComponent with all decorators applied
+            SectionedHelpMenu joining the base menu and every added section
         """
-        return self._component
+        return SectionedHelpMenu(self._sections, self._component._section_ids)
 
 
-def create_default_help_menu() -> HelpComponent:
+@functools.lru_cache(maxsize=4)
+def _default_help_text(version: int) -> str:
     """
-    Factory function to create a fully-featured default help menu.
+    Render the default help menu for a given OperationFactory registry version.
     
+    Args:
+        version: OperationFactory._version the text is rendered for
+        
     Returns:
-        HelpComponent with all standard decorators applied
+        str: Complete default help text
     """
     return (HelpMenuBuilder()
             .with_operations()
             .with_examples()
             .with_notes()
-            .build())
+            .build()
+            .get_help_text())
+
+
+class _DefaultHelpMenu(HelpComponent):
+    """
+    Default help menu that reuses the rendered text until operations change.
+    """
+    
+    # Identifiers of the sections this component renders, in order
+    _section_ids: Tuple[str, ...] = ("base", "operations", "examples", "notes")
+    
+    def get_help_text(self) -> str:
+        """
+        Get the default help text for the current set of operations.
+        
+        Returns:
+            str: Complete default help text
+        """
+        return _default_help_text(OperationFactory._version)
+
+
+def create_default_help_menu() -> HelpComponent:
+    """
+    Factory function to create a fully-featured default help menu.
+    
+    Returns:
+        HelpComponent with all standard sections, rendered once per
+        OperationFactory registry version
+    """
+    return _DefaultHelpMenu()
 
 
 def display_help():
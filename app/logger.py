@@ -26,11 +26,16 @@ class LoggingObserver(HistoryObserver):
         """
         if calculation is None:
             raise AttributeError("Calculation cannot be None")
-        logging.info(
-            f"Calculation performed: {calculation.operation} "
-            f"({calculation.operand1}, {calculation.operand2}) = "
-            f"{calculation.result}"
-        )
+        # Skip the call entirely when INFO records are dropped; otherwise let
+        # logging format the arguments only once a handler emits the record
+        if logging.getLogger().isEnabledFor(logging.INFO):
+            logging.info(
+                "Calculation performed: %s (%s, %s) = %s",
+                calculation.operation,
+                calculation.operand1,
+                calculation.operand2,
+                calculation.result,
+            )
 
 # Configure logging
 logging.basicConfig(
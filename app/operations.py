@@ -3,7 +3,7 @@
 ##########################
 
 from abc import ABC, abstractmethod
-from typing import Dict
+from typing import Dict, Optional, Tuple
 from app.exceptions import ValidationError
 from decimal import Decimal
 
@@ -408,6 +408,12 @@ class OperationFactory:
         'abs_diff': AbsoluteDifference,
     }
 
+    # Incremented whenever _operations changes so callers can cache derived data
+    _version: int = 0
+
+    # Sorted operation names, rebuilt lazily after the registry changes
+    _sorted_names: Optional[Tuple[str, ...]] = None
+
     @classmethod
     def register_operation(cls, name: str, operation_class: type) -> None:
         """
@@ -425,6 +431,38 @@ class OperationFactory:
         if not issubclass(operation_class, Operation):
             raise TypeError("Operation class must inherit from Operation")
         cls._operations[name.lower()] = operation_class
+        cls._version += 1
+        cls._sorted_names = None
+
+    @classmethod
+    def unregister_operation(cls, name: str) -> None:
+        """
+        Remove a previously registered operation type.
+
+        Args:
+            name (str): Operation identifier to remove (e.g., 'modulus').
+
+        Raises:
+            ValueError: If no operation is registered under the given name.
+        """
+        if cls._operations.pop(name.lower(), None) is None:
+            raise ValueError(f"Unknown operation: {name}")
+        cls._version += 1
+        cls._sorted_names = None
+
+    @classmethod
+    def operation_names(cls) -> Tuple[str, ...]:
+        """
+        Get the registered operation identifiers in alphabetical order.
+
+        The tuple is cached until an operation is registered or unregistered.
+
+        Returns:
+            Tuple[str, ...]: Sorted operation identifiers.
+        """
+        if cls._sorted_names is None:
+            cls._sorted_names = tuple(sorted(cls._operations))
+        return cls._sorted_names
 
     @classmethod
     def create_operation(cls, operation_type: str) -> Operation:
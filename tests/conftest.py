@@ -0,0 +1,10 @@
+import datetime
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def iso_ts():
+    """Provide a shared ISO timestamp string together with its parsed datetime."""
+    iso_string = "2024-01-15T10:30:45"
+    return iso_string, datetime.datetime.fromisoformat(iso_string)
@@ -2,17 +2,20 @@
 Comprehensive pytest test suite for CalculatorMemento class - 100% coverage
 """
 
+import dataclasses
 import datetime
+import sys
 import time
+import types
 from decimal import Decimal
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 
 import pytest
 
 from app.calculation import Calculation
 from app.calculator import Calculator
 from app.operations import Addition
-from app.calculator_memento import CalculatorMemento
+from app.calculator_memento import CalculatorMemento, _select_iso_parser
 
 
 @pytest.fixture
@@ -53,36 +56,76 @@ def fixed_timestamp():
     return datetime.datetime(2024, 1, 15, 10, 30, 45)
 
 
-class TestCalculatorMementoInitialization:
-    """Tests for CalculatorMemento initialization."""
+@pytest.fixture
+def large_calc_history():
+    """Create a large calculation history and release it after the test."""
+    history = [
+        Calculation(
+            operation="Addition",
+            operand1=Decimal(i),
+            operand2=Decimal(i + 1)
+        )
+        for i in range(100)
+    ]
+    yield history
+    del history[:]
 
-    def test_init_with_empty_history(self):
-        """Test initialization with empty history."""
-        memento = CalculatorMemento(history=[])
-        assert memento.history == []
-        assert isinstance(memento.timestamp, datetime.datetime)
 
-    def test_init_with_calculations(self, sample_calculations):
-        """Test initialization with calculation history."""
-        memento = CalculatorMemento(history=sample_calculations)
-        assert len(memento.history) == 3
-        assert memento.history == sample_calculations
-        assert isinstance(memento.timestamp, datetime.datetime)
+@pytest.fixture
+def large_history_data():
+    """Create serialized data for a large history and release it after the test."""
+    data = {
+        'history': [
+            {
+                'operation': 'Addition',
+                'operand1': str(i),
+                'operand2': str(i + 1),
+                'result': str(i + i + 1),
+                'timestamp': '2024-01-15T10:30:45'
+            }
+            for i in range(100)
+        ],
+        'timestamp': '2024-01-15T10:30:45'
+    }
+    yield data
+    del data['history'][:]
 
-    def test_init_with_single_calculation(self, sample_calculation):
-        """Test initialization with a single calculation."""
-        memento = CalculatorMemento(history=[sample_calculation])
-        assert len(memento.history) == 1
-        assert memento.history[0] == sample_calculation
 
-    def test_init_with_custom_timestamp(self, sample_calculations, fixed_timestamp):
-        """Test initialization with a custom timestamp."""
-        memento = CalculatorMemento(
-            history=sample_calculations,
-            timestamp=fixed_timestamp
-        )
-        assert memento.timestamp == fixed_timestamp
-        assert memento.history == sample_calculations
+@pytest.fixture
+def mock_calc_from_dict(monkeypatch):
+    """Replace Calculation.from_dict with a Mock for the duration of a test."""
+    mock_from_dict = Mock()
+    monkeypatch.setattr('app.calculation.Calculation.from_dict', mock_from_dict)
+    return mock_from_dict
+
+
+class TestCalculatorMementoInitialization:
+    """Tests for CalculatorMemento initialization."""
+
+    @pytest.mark.parametrize("history_fixture,use_fixed_timestamp,expected_len", [
+        pytest.param(None, False, 0, id="empty"),
+        pytest.param("sample_calculation", False, 1, id="single"),
+        pytest.param("sample_calculations", False, 3, id="multi"),
+        pytest.param("sample_calculations", True, 3, id="multi_ts"),
+    ])
+    def test_init(self, request, fixed_timestamp, history_fixture, use_fixed_timestamp, expected_len):
+        """Test initialization with different histories and an optional custom timestamp."""
+        if history_fixture is None:
+            history = []
+        else:
+            history = request.getfixturevalue(history_fixture)
+            if not isinstance(history, list):
+                history = [history]
+        
+        if use_fixed_timestamp:
+            memento = CalculatorMemento(history=history, timestamp=fixed_timestamp)
+            assert memento.timestamp == fixed_timestamp
+        else:
+            memento = CalculatorMemento(history=history)
+            assert isinstance(memento.timestamp, datetime.datetime)
+        
+        assert len(memento.history) == expected_len
+        assert memento.history == history
 
     def test_init_timestamp_auto_generated(self, sample_calculation):
         """Test that timestamp is automatically generated if not provided."""
@@ -139,25 +182,26 @@ class TestToDict:
         assert len(result['history']) == 3
         assert result['timestamp'] == '2024-01-15T10:30:45'
 
-    def test_to_dict_calls_calculation_to_dict(self, sample_calculation, fixed_timestamp):
+    def test_to_dict_calls_calculation_to_dict(self, sample_calculation, fixed_timestamp, monkeypatch):
         """Test that to_dict calls to_dict on each calculation."""
-        with patch.object(sample_calculation, 'to_dict', return_value={'test': 'data'}) as mock_to_dict:
-            memento = CalculatorMemento(
-                history=[sample_calculation],
-                timestamp=fixed_timestamp
-            )
-            result = memento.to_dict()
-            
-            mock_to_dict.assert_called_once()
-            assert result['history'][0] == {'test': 'data'}
-
-    def test_to_dict_timestamp_format(self, sample_calculation):
-        """Test that timestamp is properly formatted as ISO string."""
-        timestamp = datetime.datetime(2024, 6, 15, 14, 30, 0, 123456)
-        memento = CalculatorMemento(history=[sample_calculation], timestamp=timestamp)
+        called = []
+        monkeypatch.setattr(sample_calculation, 'to_dict', lambda: called.append(1) or {'test': 'data'})
+        memento = CalculatorMemento(
+            history=[sample_calculation],
+            timestamp=fixed_timestamp
+        )
         result = memento.to_dict()
         
-        assert result['timestamp'] == '2024-06-15T14:30:00.123456'
+        assert called == [1]
+        assert result['history'][0] == {'test': 'data'}
+
+    def test_to_dict_timezone_aware_timestamp(self):
+        """Test that timezone-aware timestamps keep their UTC offset."""
+        timestamp = datetime.datetime(2024, 6, 15, 14, 30, 0, tzinfo=datetime.timezone.utc)
+        memento = CalculatorMemento(history=[], timestamp=timestamp)
+        result = memento.to_dict()
+
+        assert result['timestamp'] == '2024-06-15T14:30:00+00:00'
 
     def test_to_dict_returns_new_dict(self, sample_calculation, fixed_timestamp):
         """Test that to_dict returns a new dictionary each time."""
@@ -172,24 +216,49 @@ class TestToDict:
         assert result1 is not result2
         assert result1 == result2
 
+    def test_to_dict_reflects_history_appended_later(self, sample_calculations, fixed_timestamp):
+        """Test that to_dict serializes entries added to the shared history list."""
+        history = [sample_calculations[0]]
+        memento = CalculatorMemento(history=history, timestamp=fixed_timestamp)
+        memento.to_dict()
+
+        history.append(sample_calculations[1])
+
+        assert len(memento.to_dict()['history']) == 2
+
+    def test_to_dict_results_do_not_share_entries(self, sample_calculation, fixed_timestamp):
+        """Test that mutating one to_dict result does not affect later results."""
+        memento = CalculatorMemento(
+            history=[sample_calculation],
+            timestamp=fixed_timestamp
+        )
+        result1 = memento.to_dict()
+        result1['history'][0]['result'] = '999'
+
+        assert memento.to_dict()['history'][0]['result'] == str(sample_calculation.result)
+
 
 class TestFromDict:
     """Tests for from_dict class method."""
 
-    def test_from_dict_empty_history(self, fixed_timestamp):
+    def test_from_dict_empty_history(self, iso_ts):
         """Test from_dict with empty history."""
+        iso_string, iso_datetime = iso_ts
+
         data = {
             'history': [],
-            'timestamp': '2024-01-15T10:30:45'
+            'timestamp': iso_string
         }
         
         memento = CalculatorMemento.from_dict(data)
         
         assert memento.history == []
-        assert memento.timestamp == fixed_timestamp
+        assert memento.timestamp == iso_datetime
 
-    def test_from_dict_with_single_calculation(self):
+    def test_from_dict_with_single_calculation(self, iso_ts, mock_calc_from_dict):
         """Test from_dict with a single calculation."""
+        iso_string, _ = iso_ts
+
         data = {
             'history': [
                 {
@@ -197,24 +266,25 @@ class TestFromDict:
                     'operand1': '5',
                     'operand2': '10',
                     'result': '15',
-                    'timestamp': '2024-01-15T10:30:45'
+                    'timestamp': iso_string
                 }
             ],
-            'timestamp': '2024-01-15T10:30:45'
+            'timestamp': iso_string
         }
         
-        with patch('app.calculation.Calculation.from_dict') as mock_from_dict:
-            mock_calc = Mock()
-            mock_from_dict.return_value = mock_calc
-            
-            memento = CalculatorMemento.from_dict(data)
-            
-            assert len(memento.history) == 1
-            assert memento.history[0] == mock_calc
-            mock_from_dict.assert_called_once()
-
-    def test_from_dict_with_multiple_calculations(self):
+        sentinel_calc = object()
+        mock_calc_from_dict.return_value = sentinel_calc
+        
+        memento = CalculatorMemento.from_dict(data)
+        
+        assert len(memento.history) == 1
+        assert memento.history[0] is sentinel_calc
+        mock_calc_from_dict.assert_called_once()
+
+    def test_from_dict_with_multiple_calculations(self, iso_ts, mock_calc_from_dict):
         """Test from_dict with multiple calculations."""
+        iso_string, _ = iso_ts
+
         data = {
             'history': [
                 {
@@ -222,7 +292,7 @@ class TestFromDict:
                     'operand1': '5',
                     'operand2': '10',
                     'result': '15',
-                    'timestamp': '2024-01-15T10:30:45'
+                    'timestamp': iso_string
                 },
                 {
                     'operation': 'Subtraction',
@@ -232,75 +302,105 @@ class TestFromDict:
                     'timestamp': '2024-01-15T10:31:00'
                 }
             ],
-            'timestamp': '2024-01-15T10:30:45'
+            'timestamp': iso_string
         }
         
-        with patch('app.calculation.Calculation.from_dict') as mock_from_dict:
-            mock_calc1 = Mock()
-            mock_calc2 = Mock()
-            mock_from_dict.side_effect = [mock_calc1, mock_calc2]
-            
-            memento = CalculatorMemento.from_dict(data)
-            
-            assert len(memento.history) == 2
-            assert memento.history[0] == mock_calc1
-            assert memento.history[1] == mock_calc2
-            assert mock_from_dict.call_count == 2
-
-    def test_from_dict_calls_calculation_from_dict(self):
+        sentinel_calc1 = object()
+        sentinel_calc2 = object()
+        mock_calc_from_dict.side_effect = [sentinel_calc1, sentinel_calc2]
+        
+        memento = CalculatorMemento.from_dict(data)
+        
+        assert len(memento.history) == 2
+        assert memento.history[0] is sentinel_calc1
+        assert memento.history[1] is sentinel_calc2
+        assert mock_calc_from_dict.call_count == 2
+
+    def test_from_dict_calls_calculation_from_dict(self, iso_ts, mock_calc_from_dict):
         """Test that from_dict calls Calculation.from_dict for each calculation."""
+        iso_string, _ = iso_ts
+
         calc_data = {
             'operation': 'Multiplication',
             'operand1': '3',
             'operand2': '7',
             'result': '21',
-            'timestamp': '2024-01-15T10:30:45'
+            'timestamp': iso_string
         }
         
         data = {
             'history': [calc_data],
-            'timestamp': '2024-01-15T10:30:45'
+            'timestamp': iso_string
         }
         
-        with patch('app.calculation.Calculation.from_dict') as mock_from_dict:
-            mock_calc = Mock()
-            mock_from_dict.return_value = mock_calc
-            
-            memento = CalculatorMemento.from_dict(data)
-            
-            mock_from_dict.assert_called_once_with(calc_data)
-
-    def test_from_dict_parses_timestamp(self):
-        """Test that from_dict correctly parses ISO timestamp string."""
-        data = {
-            'history': [],
-            'timestamp': '2024-06-15T14:30:00.123456'
-        }
+        mock_calc_from_dict.return_value = object()
         
         memento = CalculatorMemento.from_dict(data)
         
-        expected_timestamp = datetime.datetime(2024, 6, 15, 14, 30, 0, 123456)
-        assert memento.timestamp == expected_timestamp
+        mock_calc_from_dict.assert_called_once_with(calc_data)
+
+    def test_from_dict_uses_fast_iso_parser(self, monkeypatch, fixed_timestamp):
+        """Test that from_dict parses timestamps with the module-level fast parser."""
+        parsed = []
+
+        def fake_parse_datetime(value):
+            parsed.append(value)
+            return fixed_timestamp
+
+        monkeypatch.setattr('app.calculator_memento.parse_datetime', fake_parse_datetime)
+        memento = CalculatorMemento.from_dict({
+            'history': [],
+            'timestamp': '2024-01-15T10:30:45'
+        })
+
+        assert parsed == ['2024-01-15T10:30:45']
+        assert memento.timestamp == fixed_timestamp
+
+    def test_select_iso_parser_prefers_ciso8601(self, monkeypatch):
+        """Test that ciso8601's parser is chosen when the package is importable."""
+        def fake_parse_datetime(value):
+            return value
 
-    def test_from_dict_preserves_calculation_order(self):
+        monkeypatch.setitem(sys.modules, 'ciso8601', types.SimpleNamespace(parse_datetime=fake_parse_datetime))
+
+        assert _select_iso_parser() is fake_parse_datetime
+
+    def test_select_iso_parser_falls_back_to_fromisoformat(self, monkeypatch):
+        """Test that datetime.fromisoformat is used when ciso8601 is missing."""
+        # A None entry in sys.modules makes the import raise ImportError
+        monkeypatch.setitem(sys.modules, 'ciso8601', None)
+
+        assert _select_iso_parser() == datetime.datetime.fromisoformat
+
+    def test_from_dict_empty_history_skips_calculation_from_dict(self, iso_ts, mock_calc_from_dict):
+        """Test that an empty history never reaches Calculation.from_dict."""
+        iso_string, _ = iso_ts
+
+        memento = CalculatorMemento.from_dict({'history': [], 'timestamp': iso_string})
+
+        assert memento.history == []
+        mock_calc_from_dict.assert_not_called()
+
+    def test_from_dict_preserves_calculation_order(self, iso_ts, mock_calc_from_dict):
         """Test that from_dict preserves the order of calculations."""
+        iso_string, _ = iso_ts
+
         data = {
             'history': [
-                {'operation': 'Addition', 'operand1': '1', 'operand2': '1', 'result': '2', 'timestamp': '2024-01-15T10:30:45'},
+                {'operation': 'Addition', 'operand1': '1', 'operand2': '1', 'result': '2', 'timestamp': iso_string},
                 {'operation': 'Subtraction', 'operand1': '5', 'operand2': '3', 'result': '2', 'timestamp': '2024-01-15T10:31:00'},
                 {'operation': 'Multiplication', 'operand1': '2', 'operand2': '4', 'result': '8', 'timestamp': '2024-01-15T10:32:00'}
             ],
-            'timestamp': '2024-01-15T10:30:45'
+            'timestamp': iso_string
         }
         
-        with patch('app.calculation.Calculation.from_dict') as mock_from_dict:
-            mock_calcs = [Mock(), Mock(), Mock()]
-            mock_from_dict.side_effect = mock_calcs
-            
-            memento = CalculatorMemento.from_dict(data)
-            
-            for i, mock_calc in enumerate(mock_calcs):
-                assert memento.history[i] == mock_calc
+        sentinel_calcs = [object(), object(), object()]
+        mock_calc_from_dict.side_effect = sentinel_calcs
+        
+        memento = CalculatorMemento.from_dict(data)
+        
+        for i, sentinel_calc in enumerate(sentinel_calcs):
+            assert memento.history[i] is sentinel_calc
 
 
 class TestRoundTrip:
@@ -316,7 +416,7 @@ class TestRoundTrip:
         assert restored.timestamp == original.timestamp
         assert len(restored.history) == 0
 
-    def test_round_trip_with_calculations(self, sample_calculations, fixed_timestamp):
+    def test_round_trip_with_calculations(self, sample_calculations, fixed_timestamp, mock_calc_from_dict):
         """Test round-trip conversion with calculations."""
         original = CalculatorMemento(
             history=sample_calculations,
@@ -325,49 +425,33 @@ class TestRoundTrip:
         
         data = original.to_dict()
         
-        with patch('app.calculation.Calculation.from_dict') as mock_from_dict:
-            mock_from_dict.side_effect = sample_calculations
-            restored = CalculatorMemento.from_dict(data)
-            
-            assert restored.timestamp == original.timestamp
-            assert len(restored.history) == len(original.history)
-
-    def test_round_trip_preserves_timestamp_precision(self):
-        """Test that round-trip preserves timestamp microsecond precision."""
-        timestamp = datetime.datetime(2024, 6, 15, 14, 30, 0, 999999)
-        original = CalculatorMemento(history=[], timestamp=timestamp)
-        
-        data = original.to_dict()
+        mock_calc_from_dict.side_effect = sample_calculations
         restored = CalculatorMemento.from_dict(data)
         
         assert restored.timestamp == original.timestamp
-        assert restored.timestamp.microsecond == 999999
+        assert len(restored.history) == len(original.history)
+
+    @pytest.mark.parametrize("dt_str,dt", [
+        pytest.param('2024-01-15T10:30:45', datetime.datetime(2024, 1, 15, 10, 30, 45), id="seconds"),
+        pytest.param('2024-06-15T14:30:00.123456', datetime.datetime(2024, 6, 15, 14, 30, 0, 123456), id="microseconds"),
+        pytest.param('2024-06-15T14:30:00.999999', datetime.datetime(2024, 6, 15, 14, 30, 0, 999999), id="max-microseconds"),
+        pytest.param('1900-01-01T00:00:00', datetime.datetime(1900, 1, 1), id="very-old"),
+        pytest.param('2099-12-31T23:59:59', datetime.datetime(2099, 12, 31, 23, 59, 59), id="future"),
+    ])
+    def test_iso_roundtrip(self, dt_str, dt):
+        """Test that timestamps serialize to ISO strings and parse back unchanged."""
+        original = CalculatorMemento(history=[], timestamp=dt)
+        
+        data = original.to_dict()
+        assert data['timestamp'] == dt_str
+        
+        restored = CalculatorMemento.from_dict(data)
+        assert restored.timestamp == dt
 
 
 class TestEdgeCases:
     """Tests for edge cases and special scenarios."""
 
-    def test_memento_with_very_old_timestamp(self):
-        """Test memento with very old timestamp."""
-        old_timestamp = datetime.datetime(1900, 1, 1, 0, 0, 0)
-        memento = CalculatorMemento(history=[], timestamp=old_timestamp)
-        
-        assert memento.timestamp == old_timestamp
-        
-        data = memento.to_dict()
-        assert data['timestamp'] == '1900-01-01T00:00:00'
-
-    def test_memento_with_future_timestamp(self):
-        """Test memento with future timestamp."""
-        future_timestamp = datetime.datetime(2099, 12, 31, 23, 59, 59)
-        memento = CalculatorMemento(history=[], timestamp=future_timestamp)
-        
-        assert memento.timestamp == future_timestamp
-        
-        data = memento.to_dict()
-        restored = CalculatorMemento.from_dict(data)
-        assert restored.timestamp == future_timestamp
-
     def test_memento_history_is_list_reference(self, sample_calculations):
         """Test that memento stores reference to history list."""
         history = sample_calculations.copy()
@@ -403,47 +487,22 @@ class TestEdgeCases:
         assert len(memento1.history) != len(memento2.history)
 
 
-    def test_to_dict_with_large_history(self):
+    def test_to_dict_with_large_history(self, large_calc_history):
         """Test to_dict with a large number of calculations."""
-        # Create a large history
-        large_history = []
-        for i in range(100):
-            calc = Calculation(
-                operation="Addition",
-                operand1=Decimal(str(i)),
-                operand2=Decimal(str(i + 1))
-            )
-            large_history.append(calc)
-        
-        memento = CalculatorMemento(history=large_history)
+        memento = CalculatorMemento(history=large_calc_history)
         result = memento.to_dict()
         
         assert len(result['history']) == 100
 
-    def test_from_dict_with_large_history(self):
+    def test_from_dict_with_large_history(self, large_history_data, mock_calc_from_dict):
         """Test from_dict with a large number of calculations."""
-        # Create large history data
-        history_data = []
-        for i in range(100):
-            history_data.append({
-                'operation': 'Addition',
-                'operand1': str(i),
-                'operand2': str(i + 1),
-                'result': str(i + i + 1),
-                'timestamp': '2024-01-15T10:30:45'
-            })
-        
-        data = {
-            'history': history_data,
-            'timestamp': '2024-01-15T10:30:45'
-        }
+        sentinel_calc = object()
+        mock_calc_from_dict.return_value = sentinel_calc
+        memento = CalculatorMemento.from_dict(large_history_data)
         
-        with patch('app.calculation.Calculation.from_dict') as mock_from_dict:
-            mock_from_dict.return_value = Mock()
-            memento = CalculatorMemento.from_dict(data)
-            
-            assert len(memento.history) == 100
-            assert mock_from_dict.call_count == 100
+        assert len(memento.history) == 100
+        assert all(calc is sentinel_calc for calc in memento.history)
+        assert mock_calc_from_dict.call_count == 100
 
 
 class TestDataclassFeatures:
@@ -509,4 +568,25 @@ class TestDataclassFeatures:
         repr_str = repr(memento)
         assert 'CalculatorMemento' in repr_str
         assert 'history' in repr_str
-        assert 'timestamp' in repr_str
\ No newline at end of file
+        assert 'timestamp' in repr_str
+
+    def test_memento_is_frozen(self, fixed_timestamp):
+        """Test that memento fields cannot be reassigned."""
+        memento = CalculatorMemento(history=[], timestamp=fixed_timestamp)
+        
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            memento.timestamp = datetime.datetime(2024, 1, 1)
+
+    def test_memento_is_unhashable(self, fixed_timestamp):
+        """Test that mementos are explicitly unhashable since history is a mutable list."""
+        memento = CalculatorMemento(history=[], timestamp=fixed_timestamp)
+        
+        assert CalculatorMemento.__hash__ is None
+        with pytest.raises(TypeError, match="unhashable type: 'CalculatorMemento'"):
+            hash(memento)
+
+    def test_memento_uses_slots(self):
+        """Test that memento instances do not carry a __dict__."""
+        memento = CalculatorMemento(history=[])
+        
+        assert not hasattr(memento, '__dict__')
@@ -7,509 +7,327 @@ and initialization processes.
 """
 
 import pytest
-from unittest.mock import patch, MagicMock, call
+from unittest.mock import Mock, create_autospec, patch, DEFAULT
 from decimal import Decimal
 import logging
 
-from app.calculator_repl import calculator_repl
+from app import calculator_repl as _repl_mod
+from app.calculator import Calculator
+from app.calculator_repl import calculator_repl, _init_calc, _loop
 from app.exceptions import OperationError, ValidationError
+from app.history import AutoSaveObserver
+from app.logger import LoggingObserver
+from app.operations import Operation
+
+# Input scripts shared by several tests
+EXIT_ONLY = ('exit',)
+HELP_EXIT = ('help', 'exit')
+ADD_5_3_EXIT = ('add', '5', '3', 'exit')
+
+
+@pytest.fixture(scope="session")
+def _calc_template():
+    """Build a Calculator-specced mock once per session."""
+    return Mock(spec=Calculator)
+
+
+@pytest.fixture
+def mock_calc(_calc_template):
+    """Provide the shared Calculator mock with all calls and configuration reset."""
+    _calc_template.reset_mock(return_value=True, side_effect=True)
+    return _calc_template
+
+
+@pytest.fixture
+def mock_observers():
+    """Provide fresh autospecced (AutoSaveObserver, LoggingObserver) class mocks.
+
+    These are built per test rather than reset from a session template:
+    reset_mock(return_value=True) would replace the autospecced instance
+    mock with an unspecced one, and a bare reset_mock() would leak any
+    return_value or side_effect a test configures.
+    """
+    return create_autospec(AutoSaveObserver), create_autospec(LoggingObserver)
+
+
+@pytest.fixture(scope="session")
+def _operation_template():
+    """Build an Operation-specced mock once per session."""
+    return Mock(spec=Operation)
+
+
+@pytest.fixture
+def mock_operation(_operation_template):
+    """Provide the shared Operation mock with all calls and configuration reset."""
+    _operation_template.reset_mock(return_value=True, side_effect=True)
+    return _operation_template
+
+
+@pytest.fixture(autouse=True)
+def repl_patches():
+    """Patch console input and the REPL's help display for every test."""
+    with patch.multiple('builtins', input=DEFAULT) as console, \
+         patch.multiple(_repl_mod, display_help=DEFAULT) as repl:
+        yield {**console, **repl}
+
+
+@pytest.fixture
+def calc(monkeypatch, mock_calc):
+    """Make the REPL's Calculator() return the shared Calculator mock."""
+    monkeypatch.setattr(_repl_mod, 'Calculator', lambda *args, **kwargs: mock_calc)
+    return mock_calc
+
+
+@pytest.fixture
+def observers(monkeypatch, mock_observers):
+    """Install the autospecced observer classes that _init_calc registers."""
+    autosave_observer, logging_observer = mock_observers
+    monkeypatch.setattr(_repl_mod, 'AutoSaveObserver', autosave_observer)
+    monkeypatch.setattr(_repl_mod, 'LoggingObserver', logging_observer)
+    return mock_observers
+
+
+@pytest.fixture
+def mock_input(repl_patches):
+    """The patched builtins.input."""
+    return repl_patches['input']
+
+
+@pytest.fixture
+def mock_display_help(repl_patches):
+    """The patched display_help function."""
+    return repl_patches['display_help']
+
+
+@pytest.fixture
+def mock_factory(mock_operation):
+    """Patch the OperationFactory used by the REPL to create the shared Operation mock."""
+    with patch.object(_repl_mod, 'OperationFactory') as factory:
+        factory.create_operation.return_value = mock_operation
+        yield factory
 
 
 class TestCalculatorREPLBasicCommands:
     """Test basic REPL commands."""
 
-    @patch('builtins.input', side_effect=['exit'])
-    @patch('builtins.print')
-    @patch('app.calculator_repl.Calculator')
-    def test_exit_command(self, mock_calculator_class, mock_print, mock_input):
-        """Test that 'exit' command exits the REPL."""
-        mock_calc = MagicMock()
-        mock_calculator_class.return_value = mock_calc
-        
-        calculator_repl()
-        
-        mock_calc.save_history.assert_called_once()
-        assert any('Goodbye!' in str(call) for call in mock_print.call_args_list)
-
-    @patch('builtins.input', side_effect=['help', 'exit'])
-    @patch('builtins.print')
-    @patch('app.calculator_repl.display_help')
-    @patch('app.calculator_repl.Calculator')
-    def test_help_command(self, mock_calculator_class, mock_display_help, mock_print, mock_input):
+    @pytest.mark.parametrize("inputs,calc_config,expected_output,method,call_count", [
+        pytest.param(EXIT_ONLY, {}, 'Goodbye!', 'save_history', 1, id="exit"),
+        pytest.param(('history', 'exit'), {'show_history.return_value': []},
+                     'No calculations in history', 'show_history', 1, id="history-empty"),
+        pytest.param(('history', 'exit'),
+                     {'show_history.return_value': ['Addition(5, 3) = 8', 'Subtraction(10, 4) = 6']},
+                     '\nCalculation History:', 'show_history', 1, id="history-entries"),
+        pytest.param(('clear', 'exit'), {}, 'History cleared', 'clear_history', 1, id="clear"),
+        pytest.param(('undo', 'exit'), {'undo.return_value': True}, 'Operation undone', 'undo', 1, id="undo"),
+        pytest.param(('undo', 'exit'), {'undo.return_value': False}, 'Nothing to undo', 'undo', 1,
+                     id="undo-nothing"),
+        pytest.param(('redo', 'exit'), {'redo.return_value': True}, 'Operation redone', 'redo', 1, id="redo"),
+        pytest.param(('redo', 'exit'), {'redo.return_value': False}, 'Nothing to redo', 'redo', 1,
+                     id="redo-nothing"),
+        # save_history is called twice: once from 'save' command, once from 'exit'
+        pytest.param(('save', 'exit'), {}, 'History saved successfully', 'save_history', 2, id="save"),
+        pytest.param(('save', 'exit'), {'save_history.side_effect': [Exception("Save failed"), None]},
+                     'Error saving history: Save failed', 'save_history', 2, id="save-error"),
+        pytest.param(('load', 'exit'), {}, 'History loaded successfully', 'load_history', 1, id="load"),
+        pytest.param(('load', 'exit'), {'load_history.side_effect': Exception("Load failed")},
+                     'Error loading history: Load failed', 'load_history', 1, id="load-error"),
+    ])
+    def test_command(self, mock_calc, mock_input, capsys,
+                     inputs, calc_config, expected_output, method, call_count):
+        """Test that each basic command calls the calculator and reports the outcome."""
+        mock_input.side_effect = iter(inputs)
+        mock_calc.configure_mock(**calc_config)
+
+        _loop(mock_calc)
+
+        assert getattr(mock_calc, method).call_count == call_count
+        assert expected_output in capsys.readouterr().out
+
+    def test_help_command(self, mock_calc, mock_input, mock_display_help):
         """Test that 'help' command displays help menu."""
-        mock_calc = MagicMock()
-        mock_calculator_class.return_value = mock_calc
-        
-        calculator_repl()
-        
-        mock_display_help.assert_called_once()
+        mock_input.side_effect = iter(HELP_EXIT)
 
-    @patch('builtins.input', side_effect=['history', 'exit'])
-    @patch('builtins.print')
-    @patch('app.calculator_repl.Calculator')
-    def test_history_command_empty(self, mock_calculator_class, mock_print, mock_input):
-        """Test 'history' command with empty history."""
-        mock_calc = MagicMock()
-        mock_calc.show_history.return_value = []
-        mock_calculator_class.return_value = mock_calc
-        
-        calculator_repl()
-        
-        mock_calc.show_history.assert_called_once()
-        assert any('No calculations in history' in str(call) for call in mock_print.call_args_list)
-
-    @patch('builtins.input', side_effect=['history', 'exit'])
-    @patch('builtins.print')
-    @patch('app.calculator_repl.Calculator')
-    def test_history_command_with_entries(self, mock_calculator_class, mock_print, mock_input):
-        """Test 'history' command with history entries."""
-        mock_calc = MagicMock()
-        mock_calc.show_history.return_value = [
-            'Addition(5, 3) = 8',
-            'Subtraction(10, 4) = 6'
-        ]
-        mock_calculator_class.return_value = mock_calc
-        
-        calculator_repl()
-        
-        mock_calc.show_history.assert_called_once()
-        # Check that history entries are printed
-        print_calls_str = str(mock_print.call_args_list)
-        assert 'Calculation History' in print_calls_str
-
-    @patch('builtins.input', side_effect=['clear', 'exit'])
-    @patch('builtins.print')
-    @patch('app.calculator_repl.Calculator')
-    def test_clear_command(self, mock_calculator_class, mock_print, mock_input):
-        """Test 'clear' command clears history."""
-        mock_calc = MagicMock()
-        mock_calculator_class.return_value = mock_calc
-        
-        calculator_repl()
-        
-        mock_calc.clear_history.assert_called_once()
-        assert any('History cleared' in str(call) for call in mock_print.call_args_list)
-
-    @patch('builtins.input', side_effect=['undo', 'exit'])
-    @patch('builtins.print')
-    @patch('app.calculator_repl.Calculator')
-    def test_undo_command_success(self, mock_calculator_class, mock_print, mock_input):
-        """Test 'undo' command when undo is successful."""
-        mock_calc = MagicMock()
-        mock_calc.undo.return_value = True
-        mock_calculator_class.return_value = mock_calc
-        
-        calculator_repl()
-        
-        mock_calc.undo.assert_called_once()
-        assert any('Operation undone' in str(call) for call in mock_print.call_args_list)
-
-    @patch('builtins.input', side_effect=['undo', 'exit'])
-    @patch('builtins.print')
-    @patch('app.calculator_repl.Calculator')
-    def test_undo_command_nothing_to_undo(self, mock_calculator_class, mock_print, mock_input):
-        """Test 'undo' command when nothing to undo."""
-        mock_calc = MagicMock()
-        mock_calc.undo.return_value = False
-        mock_calculator_class.return_value = mock_calc
-        
-        calculator_repl()
-        
-        mock_calc.undo.assert_called_once()
-        assert any('Nothing to undo' in str(call) for call in mock_print.call_args_list)
-
-    @patch('builtins.input', side_effect=['redo', 'exit'])
-    @patch('builtins.print')
-    @patch('app.calculator_repl.Calculator')
-    def test_redo_command_success(self, mock_calculator_class, mock_print, mock_input):
-        """Test 'redo' command when redo is successful."""
-        mock_calc = MagicMock()
-        mock_calc.redo.return_value = True
-        mock_calculator_class.return_value = mock_calc
-        
-        calculator_repl()
-        
-        mock_calc.redo.assert_called_once()
-        assert any('Operation redone' in str(call) for call in mock_print.call_args_list)
-
-    @patch('builtins.input', side_effect=['redo', 'exit'])
-    @patch('builtins.print')
-    @patch('app.calculator_repl.Calculator')
-    def test_redo_command_nothing_to_redo(self, mock_calculator_class, mock_print, mock_input):
-        """Test 'redo' command when nothing to redo."""
-        mock_calc = MagicMock()
-        mock_calc.redo.return_value = False
-        mock_calculator_class.return_value = mock_calc
-        
-        calculator_repl()
-        
-        mock_calc.redo.assert_called_once()
-        assert any('Nothing to redo' in str(call) for call in mock_print.call_args_list)
-
-    @patch('builtins.input', side_effect=['save', 'exit'])
-    @patch('builtins.print')
-    @patch('app.calculator_repl.Calculator')
-    def test_save_command_success(self, mock_calculator_class, mock_print, mock_input):
-        """Test 'save' command saves history successfully."""
-        mock_calc = MagicMock()
-        mock_calculator_class.return_value = mock_calc
-        
-        calculator_repl()
-        
-        # save_history is called twice: once from 'save' command, once from 'exit'
-        assert mock_calc.save_history.call_count == 2
-        assert any('History saved successfully' in str(call) for call in mock_print.call_args_list)
-
-    @patch('builtins.input', side_effect=['save', 'exit'])
-    @patch('builtins.print')
-    @patch('app.calculator_repl.Calculator')
-    def test_save_command_error(self, mock_calculator_class, mock_print, mock_input):
-        """Test 'save' command when save fails."""
-        mock_calc = MagicMock()
-        mock_calc.save_history.side_effect = [Exception("Save failed"), None]
-        mock_calculator_class.return_value = mock_calc
-        
-        calculator_repl()
-        
-        assert any('Error saving history' in str(call) for call in mock_print.call_args_list)
-
-    @patch('builtins.input', side_effect=['load', 'exit'])
-    @patch('builtins.print')
-    @patch('app.calculator_repl.Calculator')
-    def test_load_command_success(self, mock_calculator_class, mock_print, mock_input):
-        """Test 'load' command loads history successfully."""
-        mock_calc = MagicMock()
-        mock_calculator_class.return_value = mock_calc
-        
-        calculator_repl()
-        
-        mock_calc.load_history.assert_called()
-        assert any('History loaded successfully' in str(call) for call in mock_print.call_args_list)
-
-    @patch('builtins.input', side_effect=['load', 'exit'])
-    @patch('builtins.print')
-    @patch('app.calculator_repl.Calculator')
-    def test_load_command_error(self, mock_calculator_class, mock_print, mock_input):
-        """Test 'load' command when load fails."""
-        mock_calc = MagicMock()
-        mock_calc.load_history.side_effect = Exception("Load failed")
-        mock_calculator_class.return_value = mock_calc
-        
-        calculator_repl()
-        
-        assert any('Error loading history' in str(call) for call in mock_print.call_args_list)
+        _loop(mock_calc)
+
+        mock_display_help.assert_called_once()
 
 
 class TestCalculatorREPLOperations:
     """Test arithmetic operations through the REPL."""
 
-    @patch('builtins.input', side_effect=['add', '5', '3', 'exit'])
-    @patch('builtins.print')
-    @patch('app.calculator_repl.OperationFactory')
-    @patch('app.calculator_repl.Calculator')
-    def test_valid_operation_add(self, mock_calculator_class, mock_factory, mock_print, mock_input):
-        """Test performing a valid addition operation."""
-        mock_calc = MagicMock()
+    @pytest.mark.parametrize("inputs,ret,side,expected", [
+        pytest.param(ADD_5_3_EXIT, Decimal('8'), None, '\nResult: 8', id="add"),
+        pytest.param(('multiply', '6', '7', 'exit'), Decimal('42'), None, '\nResult: 42', id="multiply"),
+        pytest.param(('add', 'cancel', 'exit'), None, None, 'Operation cancelled', id="cancel-first"),
+        pytest.param(('add', '5', 'cancel', 'exit'), None, None, 'Operation cancelled', id="cancel-second"),
+        pytest.param(('divide', '10', '0', 'exit'), None, ValidationError("Division by zero"),
+                     'Error: Division by zero', id="validation-error"),
+        pytest.param(ADD_5_3_EXIT, None, OperationError("Operation failed"),
+                     'Error: Operation failed', id="operation-error"),
+        pytest.param(ADD_5_3_EXIT, None, RuntimeError("Unexpected error"),
+                     'Unexpected error: Unexpected error', id="unexpected-error"),
+    ])
+    def test_operation(self, mock_calc, mock_factory, mock_input, capsys, inputs, ret, side, expected):
+        """Test running an operation through the REPL and reporting its outcome."""
+        mock_input.side_effect = iter(inputs)
+        mock_calc.perform_operation.return_value = ret
+        mock_calc.perform_operation.side_effect = side
+
+        _loop(mock_calc)
+
+        mock_factory.create_operation.assert_called_with(inputs[0])
+        # Cancelling at either prompt must stop before the calculation runs
+        assert mock_calc.perform_operation.called == ('cancel' not in inputs)
+        assert expected in capsys.readouterr().out
+
+    def test_operation_passes_operands_to_calculator(self, mock_calc, mock_factory, mock_operation, mock_input):
+        """Test that the created operation and entered operands reach the calculator."""
+        mock_input.side_effect = iter(ADD_5_3_EXIT)
         mock_calc.perform_operation.return_value = Decimal('8')
-        mock_calculator_class.return_value = mock_calc
-        
-        mock_operation = MagicMock()
-        mock_factory.create_operation.return_value = mock_operation
-        
-        calculator_repl()
-        
-        mock_factory.create_operation.assert_called_with('add')
+
+        _loop(mock_calc)
+
         mock_calc.set_operation.assert_called_with(mock_operation)
         mock_calc.perform_operation.assert_called_with('5', '3')
-        assert any('Result: 8' in str(call) for call in mock_print.call_args_list)
-
-    @patch('builtins.input', side_effect=['multiply', '6', '7', 'exit'])
-    @patch('builtins.print')
-    @patch('app.calculator_repl.OperationFactory')
-    @patch('app.calculator_repl.Calculator')
-    def test_valid_operation_multiply(self, mock_calculator_class, mock_factory, mock_print, mock_input):
-        """Test performing a valid multiplication operation."""
-        mock_calc = MagicMock()
-        mock_calc.perform_operation.return_value = Decimal('42')
-        mock_calculator_class.return_value = mock_calc
-        
-        mock_operation = MagicMock()
-        mock_factory.create_operation.return_value = mock_operation
-        
-        calculator_repl()
-        
-        mock_factory.create_operation.assert_called_with('multiply')
-        assert any('Result: 42' in str(call) for call in mock_print.call_args_list)
-
-    @patch('builtins.input', side_effect=['add', 'cancel', 'exit'])
-    @patch('builtins.print')
-    @patch('app.calculator_repl.OperationFactory')
-    @patch('app.calculator_repl.Calculator')
-    def test_operation_cancelled_first_number(self, mock_calculator_class, mock_factory, mock_print, mock_input):
-        """Test cancelling operation at first number input."""
-        mock_calc = MagicMock()
-        mock_calculator_class.return_value = mock_calc
-        
-        mock_operation = MagicMock()
-        mock_factory.create_operation.return_value = mock_operation
-        
-        calculator_repl()
-        
-        mock_calc.perform_operation.assert_not_called()
-        assert any('Operation cancelled' in str(call) for call in mock_print.call_args_list)
-
-    @patch('builtins.input', side_effect=['add', '5', 'cancel', 'exit'])
-    @patch('builtins.print')
-    @patch('app.calculator_repl.OperationFactory')
-    @patch('app.calculator_repl.Calculator')
-    def test_operation_cancelled_second_number(self, mock_calculator_class, mock_factory, mock_print, mock_input):
-        """Test cancelling operation at second number input."""
-        mock_calc = MagicMock()
-        mock_calculator_class.return_value = mock_calc
-        
-        mock_operation = MagicMock()
-        mock_factory.create_operation.return_value = mock_operation
-        
-        calculator_repl()
-        
-        mock_calc.perform_operation.assert_not_called()
-        assert any('Operation cancelled' in str(call) for call in mock_print.call_args_list)
-
-    @patch('builtins.input', side_effect=['invalid_op', 'exit'])
-    @patch('builtins.print')
-    @patch('app.calculator_repl.OperationFactory')
-    @patch('app.calculator_repl.Calculator')
-    def test_invalid_operation_command(self, mock_calculator_class, mock_factory, mock_print, mock_input):
+
+    def test_invalid_operation_command(self, mock_calc, mock_factory, mock_input, capsys):
         """Test handling of invalid operation command."""
-        mock_calc = MagicMock()
-        mock_calculator_class.return_value = mock_calc
-        
+        mock_input.side_effect = iter(('invalid_op', 'exit'))
+
         mock_factory.create_operation.side_effect = ValueError("Unknown operation")
-        
-        calculator_repl()
-        
-        assert any("Unknown command: 'invalid_op'" in str(call) for call in mock_print.call_args_list)
-
-    @patch('builtins.input', side_effect=['divide', '10', '0', 'exit'])
-    @patch('builtins.print')
-    @patch('app.calculator_repl.OperationFactory')
-    @patch('app.calculator_repl.Calculator')
-    def test_operation_validation_error(self, mock_calculator_class, mock_factory, mock_print, mock_input):
-        """Test handling of ValidationError during operation."""
-        mock_calc = MagicMock()
-        mock_calc.perform_operation.side_effect = ValidationError("Division by zero")
-        mock_calculator_class.return_value = mock_calc
-        
-        mock_operation = MagicMock()
-        mock_factory.create_operation.return_value = mock_operation
-        
-        calculator_repl()
-        
-        assert any('Error: Division by zero' in str(call) for call in mock_print.call_args_list)
-
-    @patch('builtins.input', side_effect=['add', '5', '3', 'exit'])
-    @patch('builtins.print')
-    @patch('app.calculator_repl.OperationFactory')
-    @patch('app.calculator_repl.Calculator')
-    def test_operation_error(self, mock_calculator_class, mock_factory, mock_print, mock_input):
-        """Test handling of OperationError during operation."""
-        mock_calc = MagicMock()
-        mock_calc.perform_operation.side_effect = OperationError("Operation failed")
-        mock_calculator_class.return_value = mock_calc
-        
-        mock_operation = MagicMock()
-        mock_factory.create_operation.return_value = mock_operation
-        
-        calculator_repl()
-        
-        assert any('Error: Operation failed' in str(call) for call in mock_print.call_args_list)
-
-    @patch('builtins.input', side_effect=['add', '5', '3', 'exit'])
-    @patch('builtins.print')
-    @patch('app.calculator_repl.OperationFactory')
-    @patch('app.calculator_repl.Calculator')
-    def test_unexpected_error_during_operation(self, mock_calculator_class, mock_factory, mock_print, mock_input):
-        """Test handling of unexpected errors during operation."""
-        mock_calc = MagicMock()
-        mock_calc.perform_operation.side_effect = RuntimeError("Unexpected error")
-        mock_calculator_class.return_value = mock_calc
-        
-        mock_operation = MagicMock()
-        mock_factory.create_operation.return_value = mock_operation
-        
-        calculator_repl()
-        
-        assert any('Unexpected error' in str(call) for call in mock_print.call_args_list)
+
+        _loop(mock_calc)
+
+        assert "Unknown command: 'invalid_op'. Type 'help' for available commands." in capsys.readouterr().out
 
 
 class TestCalculatorREPLExceptionHandling:
     """Test exception handling in the REPL."""
 
-    @patch('builtins.input', side_effect=KeyboardInterrupt())
-    @patch('builtins.print')
-    @patch('app.calculator_repl.Calculator')
-    def test_keyboard_interrupt_during_input(self, mock_calculator_class, mock_print, mock_input):
-        """Test handling of KeyboardInterrupt (Ctrl+C)."""
-        mock_calc = MagicMock()
-        mock_calculator_class.return_value = mock_calc
-        
-        # Need to add 'exit' after KeyboardInterrupt to end the loop
-        mock_input.side_effect = [KeyboardInterrupt(), 'exit']
-        
-        calculator_repl()
-        
-        assert any('Operation cancelled' in str(call) for call in mock_print.call_args_list)
-
-    @patch('builtins.input', side_effect=EOFError())
-    @patch('builtins.print')
-    @patch('app.calculator_repl.Calculator')
-    def test_eof_error_during_input(self, mock_calculator_class, mock_print, mock_input):
-        """Test handling of EOFError (Ctrl+D)."""
-        mock_calc = MagicMock()
-        mock_calculator_class.return_value = mock_calc
-        
-        calculator_repl()
-        
-        assert any('Input terminated' in str(call) for call in mock_print.call_args_list)
-
-    @patch('builtins.input', side_effect=['add', '5', '3', 'exit'])
-    @patch('builtins.print')
-    @patch('app.calculator_repl.OperationFactory')
-    @patch('app.calculator_repl.Calculator')
-    def test_generic_exception_during_loop(self, mock_calculator_class, mock_factory, mock_print, mock_input):
+    @pytest.mark.parametrize("exc,expected", [
+        # 'exit' ends the loop after Ctrl+C; Ctrl+D exits on its own
+        pytest.param(KeyboardInterrupt(), '\nOperation cancelled', id="ctrl-c"),
+        pytest.param(EOFError(), '\nInput terminated. Exiting...', id="ctrl-d"),
+    ])
+    def test_input_exception(self, mock_calc, mock_input, capsys, exc, expected):
+        """Test handling of KeyboardInterrupt (Ctrl+C) and EOFError (Ctrl+D) at the prompt."""
+        mock_input.side_effect = iter((exc, 'exit'))
+
+        _loop(mock_calc)
+
+        assert expected in capsys.readouterr().out
+
+    def test_generic_exception_during_loop(self, mock_calc, mock_factory, mock_input, capsys):
         """Test handling of generic exceptions during the loop."""
-        mock_calc = MagicMock()
+        mock_input.side_effect = iter(ADD_5_3_EXIT)
         mock_calc.perform_operation.side_effect = [Exception("Random error"), None]
-        mock_calculator_class.return_value = mock_calc
-        
-        mock_operation = MagicMock()
-        mock_factory.create_operation.return_value = mock_operation
-        
+
         # Should continue after error
-        calculator_repl()
-        
-        assert any('Unexpected error' in str(call) for call in mock_print.call_args_list)
+        _loop(mock_calc)
+
+        assert 'Unexpected error: Random error' in capsys.readouterr().out
 
-    @patch('builtins.print')
-    @patch('app.calculator_repl.Calculator')
-    def test_fatal_error_during_initialization(self, mock_calculator_class, mock_print):
+    def test_fatal_error_during_initialization(self, monkeypatch, capsys):
         """Test handling of fatal error during calculator initialization."""
-        mock_calculator_class.side_effect = Exception("Fatal initialization error")
-        
+        def failing_calculator(*args, **kwargs):
+            raise Exception("Fatal initialization error")
+
+        monkeypatch.setattr(_repl_mod, 'Calculator', failing_calculator)
+
         with pytest.raises(Exception, match="Fatal initialization error"):
             calculator_repl()
-        
-        assert any('Fatal error' in str(call) for call in mock_print.call_args_list)
+
+        assert 'Fatal error: Fatal initialization error' in capsys.readouterr().out
 
 
 class TestCalculatorREPLExitHandling:
     """Test exit command variations and save on exit."""
 
-    @patch('builtins.input', side_effect=['exit'])
-    @patch('builtins.print')
-    @patch('app.calculator_repl.Calculator')
-    def test_exit_saves_history_successfully(self, mock_calculator_class, mock_print, mock_input):
+    def test_exit_saves_history_successfully(self, mock_calc, mock_input, capsys):
         """Test that exiting saves history successfully."""
-        mock_calc = MagicMock()
-        mock_calculator_class.return_value = mock_calc
-        
-        calculator_repl()
-        
+        mock_input.side_effect = iter(EXIT_ONLY)
+
+        _loop(mock_calc)
+
         mock_calc.save_history.assert_called_once()
-        assert any('History saved successfully' in str(call) for call in mock_print.call_args_list)
-        assert any('Goodbye!' in str(call) for call in mock_print.call_args_list)
+        out = capsys.readouterr().out
+        assert 'History saved successfully.' in out
+        assert 'Goodbye!' in out
 
-    @patch('builtins.input', side_effect=['exit'])
-    @patch('builtins.print')
-    @patch('app.calculator_repl.Calculator')
-    def test_exit_warning_on_save_failure(self, mock_calculator_class, mock_print, mock_input):
+    def test_exit_warning_on_save_failure(self, mock_calc, mock_input, capsys):
         """Test that exit shows warning when save fails."""
-        mock_calc = MagicMock()
+        mock_input.side_effect = iter(EXIT_ONLY)
         mock_calc.save_history.side_effect = Exception("Cannot save")
-        mock_calculator_class.return_value = mock_calc
-        
-        calculator_repl()
-        
-        assert any('Could not save history' in str(call) for call in mock_print.call_args_list)
-        assert any('Goodbye!' in str(call) for call in mock_print.call_args_list)
+
+        _loop(mock_calc)
+
+        out = capsys.readouterr().out
+        assert 'Warning: Could not save history: Cannot save' in out
+        assert 'Goodbye!' in out
 
 
 class TestCalculatorREPLInitialization:
     """Test calculator initialization and observer registration."""
 
-    @patch('builtins.input', side_effect=['exit'])
-    @patch('builtins.print')
-    @patch('app.calculator_repl.AutoSaveObserver')
-    @patch('app.calculator_repl.LoggingObserver')
-    @patch('app.calculator_repl.Calculator')
-    def test_observers_registered(self, mock_calculator_class, mock_logging_obs, 
-                                   mock_autosave_obs, mock_print, mock_input):
+    def test_observers_registered(self, calc, observers):
         """Test that observers are registered on initialization."""
-        mock_calc = MagicMock()
-        mock_calculator_class.return_value = mock_calc
-        
-        calculator_repl()
-        
+        mock_autosave_obs, mock_logging_obs = observers
+
+        assert _init_calc() is calc
+
         # Verify observers were added
-        assert mock_calc.add_observer.call_count == 2
+        mock_autosave_obs.assert_called_once_with(calc)
+        assert [c.args for c in calc.add_observer.call_args_list] == [
+            (mock_logging_obs.return_value,),
+            (mock_autosave_obs.return_value,),
+        ]
 
-    @patch('builtins.input', side_effect=['exit'])
-    @patch('builtins.print')
-    @patch('app.calculator_repl.Calculator')
-    def test_startup_message_displayed(self, mock_calculator_class, mock_print, mock_input):
+    def test_startup_message_displayed(self, calc, observers, capsys):
         """Test that startup message is displayed."""
-        mock_calc = MagicMock()
-        mock_calculator_class.return_value = mock_calc
-        
+        _init_calc()
+
+        assert "Calculator started. Type 'help' for commands." in capsys.readouterr().out
+
+    def test_repl_runs_loop_on_initialized_calculator(self, calc, observers, mock_input, capsys):
+        """Test that calculator_repl hands the initialized calculator to the command loop."""
+        mock_input.side_effect = iter(EXIT_ONLY)
+
         calculator_repl()
-        
-        assert any("Calculator started" in str(call) for call in mock_print.call_args_list)
+
+        calc.save_history.assert_called_once()
+        assert 'Goodbye!' in capsys.readouterr().out
 
 
 class TestCalculatorREPLEmptyInput:
     """Test handling of empty input."""
 
-    @patch('builtins.input', side_effect=['', 'exit'])
-    @patch('builtins.print')
-    @patch('app.calculator_repl.Calculator')
-    def test_empty_input_ignored(self, mock_calculator_class, mock_print, mock_input):
+    def test_empty_input_ignored(self, mock_calc, mock_input, capsys):
         """Test that empty input is ignored and REPL continues."""
-        mock_calc = MagicMock()
-        mock_calculator_class.return_value = mock_calc
-        
-        calculator_repl()
-        
+        mock_input.side_effect = iter(('', 'exit'))
+
+        _loop(mock_calc)
+
         # Should just continue to next input
-        assert any('Goodbye!' in str(call) for call in mock_print.call_args_list)
+        assert 'Goodbye!' in capsys.readouterr().out
 
 
 class TestCalculatorREPLWhitespace:
     """Test handling of whitespace in input."""
 
-    @patch('builtins.input', side_effect=['  exit  '])
-    @patch('builtins.print')
-    @patch('app.calculator_repl.Calculator')
-    def test_whitespace_stripped(self, mock_calculator_class, mock_print, mock_input):
+    def test_whitespace_stripped(self, mock_calc, mock_input, capsys):
         """Test that whitespace is stripped from input."""
-        mock_calc = MagicMock()
-        mock_calculator_class.return_value = mock_calc
-        
-        calculator_repl()
-        
+        mock_input.side_effect = iter(('  exit  ',))
+
+        _loop(mock_calc)
+
         # Should recognize 'exit' even with surrounding whitespace
-        assert any('Goodbye!' in str(call) for call in mock_print.call_args_list)
-
-    @patch('builtins.input', side_effect=['  HELP  ', 'exit'])
-    @patch('builtins.print')
-    @patch('app.calculator_repl.display_help')
-    @patch('app.calculator_repl.Calculator')
-    def test_case_insensitive_commands(self, mock_calculator_class, mock_display_help, 
-                                        mock_print, mock_input):
+        assert 'Goodbye!' in capsys.readouterr().out
+
+    def test_case_insensitive_commands(self, mock_calc, mock_input, mock_display_help):
         """Test that commands are case-insensitive."""
-        mock_calc = MagicMock()
-        mock_calculator_class.return_value = mock_calc
-        
-        calculator_repl()
-        
+        mock_input.side_effect = iter(('  HELP  ', 'exit'))
+
+        _loop(mock_calc)
+
         # Should recognize 'HELP' as 'help'
         mock_display_help.assert_called_once()
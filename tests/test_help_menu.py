@@ -10,32 +10,41 @@ from app.help_menu import (
     OperationsHelpDecorator,
     ExamplesHelpDecorator,
     NotesHelpDecorator,
-    create_default_help_menu
+    create_default_help_menu,
+    _render_operations_section
 )
 from app.operations import Operation, OperationFactory
 
 
+@pytest.fixture(scope="module")
+def base():
+    """Shared BaseHelpMenu; it holds no state, so decorators can all wrap one instance."""
+    return BaseHelpMenu()
+
+
+@pytest.fixture(scope="module")
+def base_text(base):
+    """Rendered text of the shared base menu."""
+    return base.get_help_text()
+
+
 class TestBaseHelpMenu:
     """Test the base help menu component."""
     
-    def test_base_help_menu_contains_basic_info(self):
+    def test_base_help_menu_contains_basic_info(self, base_text):
         """Test that base menu contains essential information."""
-        menu = BaseHelpMenu()
-        help_text = menu.get_help_text()
-        
-        assert "ADVANCED CALCULATOR" in help_text
-        assert "BASIC USAGE" in help_text
-        assert "GENERAL COMMANDS" in help_text
-        assert "help" in help_text
-        assert "exit" in help_text
+        assert "ADVANCED CALCULATOR" in base_text
+        assert "BASIC USAGE" in base_text
+        assert "GENERAL COMMANDS" in base_text
+        assert "help" in base_text
+        assert "exit" in base_text
 
 
 class TestOperationsHelpDecorator:
     """Test the operations decorator."""
     
-    def test_operations_decorator_adds_operations(self):
+    def test_operations_decorator_adds_operations(self, base):
         """Test that decorator adds operations section."""
-        base = BaseHelpMenu()
         decorated = OperationsHelpDecorator(base)
         help_text = decorated.get_help_text()
         
@@ -43,9 +52,8 @@ class TestOperationsHelpDecorator:
         assert "add" in help_text.lower()
         assert "subtract" in help_text.lower()
     
-    def test_operations_decorator_includes_all_factory_operations(self):
+    def test_operations_decorator_includes_all_factory_operations(self, base):
         """Test that all registered operations appear in help."""
-        base = BaseHelpMenu()
         decorated = OperationsHelpDecorator(base)
         help_text = decorated.get_help_text()
         
@@ -53,9 +61,8 @@ class TestOperationsHelpDecorator:
         for op_name in ['add', 'subtract', 'multiply', 'divide', 'power', 'root']:
             assert op_name in help_text.lower()
     
-    def test_operations_decorator_uses_custom_descriptions(self):
+    def test_operations_decorator_uses_custom_descriptions(self, base):
         """Test that custom descriptions can be provided."""
-        base = BaseHelpMenu()
         custom_descriptions = {
             'add': 'Custom addition description',
             'subtract': 'Custom subtraction description'
@@ -66,7 +73,7 @@ class TestOperationsHelpDecorator:
         assert "Custom addition description" in help_text
         assert "Custom subtraction description" in help_text
     
-    def test_dynamic_update_with_new_operation(self):
+    def test_dynamic_update_with_new_operation(self, base):
         """Test that help menu automatically updates when new operation is registered."""
         # Define a new custom operation
         class Square(Operation):
@@ -77,32 +84,65 @@ class TestOperationsHelpDecorator:
         OperationFactory.register_operation('square', Square)
         
         # Create help menu - should automatically include new operation
-        base = BaseHelpMenu()
         decorated = OperationsHelpDecorator(base)
         help_text = decorated.get_help_text()
         
         assert 'square' in help_text.lower()
         
         # Clean up - unregister the operation
-        if 'square' in OperationFactory._operations:
-            del OperationFactory._operations['square']
+        OperationFactory.unregister_operation('square')
+    
+    def test_operations_section_reused_until_registry_changes(self, base):
+        """Test that the operations section is cached per registry version."""
+        first = OperationsHelpDecorator(base)._generate_operations_section()
+        second = OperationsHelpDecorator(base)._generate_operations_section()
+        assert first is second
+        
+        class Halve(Operation):
+            def execute(self, a: Decimal, b: Decimal) -> Decimal:
+                return a / 2
+        
+        OperationFactory.register_operation('halve', Halve)
+        assert 'halve' in OperationsHelpDecorator(base).get_help_text()
+        
+        OperationFactory.unregister_operation('halve')
+        assert 'halve' not in OperationsHelpDecorator(base).get_help_text()
+    
+    def test_operations_section_cache_is_bounded(self, base):
+        """Test that sections for old registry versions are evicted."""
+        class Temp(Operation):
+            def execute(self, a: Decimal, b: Decimal) -> Decimal:
+                return a
+        
+        keys = []
+        for _ in range(20):
+            OperationFactory.register_operation('temp', Temp)
+            decorated = OperationsHelpDecorator(base)
+            decorated.get_help_text()
+            keys.append((OperationFactory._version, decorated._descriptions_key))
+            OperationFactory.unregister_operation('temp')
+        
+        info = _render_operations_section.cache_info()
+        assert info.currsize == info.maxsize
+        
+        # The first version's section was evicted, so it has to be rendered again
+        _render_operations_section(*keys[0])
+        assert _render_operations_section.cache_info().misses == info.misses + 1
 
 
 class TestExamplesHelpDecorator:
     """Test the examples decorator."""
     
-    def test_examples_decorator_adds_examples(self):
+    def test_examples_decorator_adds_examples(self, base):
         """Test that decorator adds examples section."""
-        base = BaseHelpMenu()
         decorated = ExamplesHelpDecorator(base)
         help_text = decorated.get_help_text()
         
         assert "USAGE EXAMPLES" in help_text
         assert "add 5 3" in help_text
     
-    def test_examples_decorator_uses_custom_examples(self):
+    def test_examples_decorator_uses_custom_examples(self, base):
         """Test that custom examples can be provided."""
-        base = BaseHelpMenu()
         custom_examples = ["custom example 1", "custom example 2"]
         decorated = ExamplesHelpDecorator(base, custom_examples)
         help_text = decorated.get_help_text()
@@ -114,18 +154,16 @@ class TestExamplesHelpDecorator:
 class TestNotesHelpDecorator:
     """Test the notes decorator."""
     
-    def test_notes_decorator_adds_notes(self):
+    def test_notes_decorator_adds_notes(self, base):
         """Test that decorator adds notes section."""
-        base = BaseHelpMenu()
         decorated = NotesHelpDecorator(base)
         help_text = decorated.get_help_text()
         
         assert "NOTES & TIPS" in help_text
         assert "Decimal numbers are supported" in help_text
     
-    def test_notes_decorator_uses_custom_notes(self):
+    def test_notes_decorator_uses_custom_notes(self, base):
         """Test that custom notes can be provided."""
-        base = BaseHelpMenu()
         custom_notes = ["Custom note 1", "Custom note 2"]
         decorated = NotesHelpDecorator(base, custom_notes)
         help_text = decorated.get_help_text()
@@ -178,6 +216,39 @@ class TestHelpMenuBuilder:
         result = builder.with_operations().with_examples().with_notes()
         
         assert isinstance(result, HelpMenuBuilder)
+    
+    def test_builder_matches_equivalent_decorator_stack(self, base):
+        """Test that the flattened builder output equals the stacked decorators."""
+        built = (HelpMenuBuilder()
+                 .with_operations()
+                 .with_examples()
+                 .with_notes()
+                 .build())
+        stacked = NotesHelpDecorator(ExamplesHelpDecorator(OperationsHelpDecorator(base)))
+        
+        assert built.get_help_text() == stacked.get_help_text()
+        assert built._section_ids == stacked._section_ids
+    
+    def test_built_menu_reuses_rendered_text(self):
+        """Test that repeated calls on one built menu return the cached text."""
+        help_menu = HelpMenuBuilder().with_operations().with_examples().build()
+        
+        assert help_menu.get_help_text() is help_menu.get_help_text()
+    
+    def test_built_menu_reflects_later_registrations(self):
+        """Test that a built menu still picks up operations registered afterwards."""
+        help_menu = HelpMenuBuilder().with_operations().build()
+        assert 'triple' not in help_menu.get_help_text()
+        
+        class Triple(Operation):
+            def execute(self, a: Decimal, b: Decimal) -> Decimal:
+                return a * 3
+        
+        OperationFactory.register_operation('triple', Triple)
+        try:
+            assert 'triple' in help_menu.get_help_text()
+        finally:
+            OperationFactory.unregister_operation('triple')
 
 
 class TestDefaultHelpMenu:
@@ -195,14 +266,33 @@ class TestDefaultHelpMenu:
         assert "AVAILABLE OPERATIONS" in help_text
         assert "USAGE EXAMPLES" in help_text
         assert "NOTES & TIPS" in help_text
+    
+    def test_default_help_menu_matches_builder_output(self):
+        """Test that the cached default menu renders the same text as the builder."""
+        built = (HelpMenuBuilder()
+                 .with_operations()
+                 .with_examples()
+                 .with_notes()
+                 .build())
+        
+        default = create_default_help_menu()
+        
+        assert default.get_help_text() == built.get_help_text()
+        assert default._section_ids == built._section_ids
+    
+    def test_default_help_text_rendered_once_per_registry_version(self):
+        """Test that repeated default menus reuse the rendered text."""
+        first = create_default_help_menu().get_help_text()
+        second = create_default_help_menu().get_help_text()
+        
+        assert first is second
 
 
 class TestDecoratorPattern:
     """Test that the Decorator pattern is properly implemented."""
     
-    def test_multiple_decorators_can_be_stacked(self):
+    def test_multiple_decorators_can_be_stacked(self, base):
         """Test that multiple decorators can wrap the same component."""
-        base = BaseHelpMenu()
         
         # Stack decorators
         with_ops = OperationsHelpDecorator(base)
@@ -216,21 +306,23 @@ class TestDecoratorPattern:
         assert "USAGE EXAMPLES" in help_text
         assert "NOTES & TIPS" in help_text
     
-    def test_decorator_order_affects_output(self):
+    def test_decorator_order_affects_output(self, base):
         """Test that decorator order matters."""
-        base = BaseHelpMenu()
         
         # Different order
         order1 = NotesHelpDecorator(ExamplesHelpDecorator(OperationsHelpDecorator(base)))
         order2 = OperationsHelpDecorator(ExamplesHelpDecorator(NotesHelpDecorator(base)))
         
+        # Both should have all sections but in different order
+        assert order1._section_ids == ("base", "operations", "examples", "notes")
+        assert order2._section_ids == ("base", "notes", "examples", "operations")
+        assert order1._section_ids != order2._section_ids
+        
+        # The rendered headers must follow the same order as the section ids
         text1 = order1.get_help_text()
         text2 = order2.get_help_text()
-        
-        # Both should have all content but in different order
-        assert text1 != text2
-        assert "AVAILABLE OPERATIONS" in text1
-        assert "AVAILABLE OPERATIONS" in text2
+        assert text1.index("AVAILABLE OPERATIONS") < text1.index("USAGE EXAMPLES") < text1.index("NOTES & TIPS")
+        assert text2.index("NOTES & TIPS") < text2.index("USAGE EXAMPLES") < text2.index("AVAILABLE OPERATIONS")
 
 
 class TestDynamicBehavior:
@@ -256,8 +348,7 @@ class TestDynamicBehavior:
         assert 'cube' in updated_text.lower()
         
         # Clean up
-        if 'cube' in OperationFactory._operations:
-            del OperationFactory._operations['cube']
+        OperationFactory.unregister_operation('cube')
     
     def test_no_manual_updates_needed(self):
         """Test that no manual updates are needed when operations change."""
@@ -284,5 +375,4 @@ class TestDynamicBehavior:
         assert 'testop' in text2.lower()
         
         # Clean up
-        if 'testop' in OperationFactory._operations:
-            del OperationFactory._operations['testop']
+        OperationFactory.unregister_operation('testop')
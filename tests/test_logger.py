@@ -1,26 +1,36 @@
 
 
+import logging
 import pytest
-from unittest.mock import Mock, patch
-from app.calculation import Calculation
+from types import SimpleNamespace
+from unittest.mock import patch
 from app.logger import LoggingObserver
 # Test cases for LoggingObserver
 
-# Sample setup for mock calculation
-calculation_mock = Mock(spec=Calculation)
-calculation_mock.operation = "addition"
-calculation_mock.operand1 = 5
-calculation_mock.operand2 = 3
-calculation_mock.result = 8
+# Sample calculation; the observer only reads these four attributes
+calculation_stub = SimpleNamespace(operation="addition", operand1=5, operand2=3, result=8)
 
 @patch('logging.info')
-def test_logging_observer_logs_calculation(logging_info_mock):
+def test_logging_observer_logs_calculation(logging_info_mock, caplog):
+    caplog.set_level(logging.INFO)
     observer = LoggingObserver()
-    observer.update(calculation_mock)
+    observer.update(calculation_stub)
     logging_info_mock.assert_called_once_with(
-        "Calculation performed: addition (5, 3) = 8"
+        "Calculation performed: %s (%s, %s) = %s", "addition", 5, 3, 8
     )
 
+def test_logging_observer_message_format(caplog):
+    caplog.set_level(logging.INFO)
+    LoggingObserver().update(calculation_stub)
+    assert "Calculation performed: addition (5, 3) = 8" in caplog.messages
+
+@patch('logging.info')
+def test_logging_observer_skips_when_info_disabled(logging_info_mock, caplog):
+    caplog.set_level(logging.WARNING)
+    observer = LoggingObserver()
+    observer.update(calculation_stub)
+    logging_info_mock.assert_not_called()
+
 def test_logging_observer_no_calculation():
     observer = LoggingObserver()
     with pytest.raises(AttributeError):
@@ -306,4 +306,42 @@ class TestOperationFactory:
             pass
 
         with pytest.raises(TypeError, match="Operation class must inherit"):
-            OperationFactory.register_operation("invalid", InvalidOperation)
\ No newline at end of file
+            OperationFactory.register_operation("invalid", InvalidOperation)
+
+    def test_unregister_operation(self):
+        """Test unregistering an operation removes it and bumps the registry version."""
+        class TempOperation(Operation):
+            def execute(self, a: Decimal, b: Decimal) -> Decimal:
+                return a
+
+        OperationFactory.register_operation("temp_op", TempOperation)
+        version = OperationFactory._version
+        OperationFactory.unregister_operation("TEMP_OP")
+
+        assert OperationFactory._version == version + 1
+        with pytest.raises(ValueError, match="Unknown operation: temp_op"):
+            OperationFactory.create_operation("temp_op")
+
+    def test_operation_names_sorted_and_refreshed(self):
+        """Test that operation names are sorted and reflect registry changes."""
+        names = OperationFactory.operation_names()
+        assert names == tuple(sorted(names))
+        assert 'add' in names
+        assert OperationFactory.operation_names() is names
+
+        class ZetaOperation(Operation):
+            def execute(self, a: Decimal, b: Decimal) -> Decimal:
+                return a
+
+        OperationFactory.register_operation("zeta_op", ZetaOperation)
+        assert "zeta_op" in OperationFactory.operation_names()
+
+        OperationFactory.unregister_operation("zeta_op")
+        assert "zeta_op" not in OperationFactory.operation_names()
+
+    def test_unregister_unknown_operation(self):
+        """Test unregistering an unknown operation raises error."""
+        version = OperationFactory._version
+        with pytest.raises(ValueError, match="Unknown operation: missing_op"):
+            OperationFactory.unregister_operation("missing_op")
+        assert OperationFactory._version == version